@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """Debug script to test API responses"""
 
-import requests
 import json
 import re
+from polishdict.api import get_session
 
 def test_word(word):
     """Test fetching a word from Wiktionary"""
@@ -18,12 +18,16 @@ def test_word(word):
         'action': 'parse',
         'page': word,
         'format': 'json',
-        'prop': 'text|sections',
-        'disabletoc': 1
+        'formatversion': 2,
+        'prop': 'text',
+        'disabletoc': 1,
+        'disableeditsection': 1,
+        'disablelimitreport': 1,
+        'redirects': 1
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = get_session().get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -35,7 +39,7 @@ def test_word(word):
             print("No parse data in response")
             return
 
-        html_content = data['parse']['text']['*']
+        html_content = data['parse']['text']
 
         print(f"HTML length: {len(html_content)}")
         print("\nFirst 2000 characters of HTML:")
@@ -3,6 +3,7 @@
 Debug aspect extraction for a specific word
 """
 
+import logging
 import sys
 from polishdict.api import PolishDictionaryAPI
 
@@ -11,6 +12,9 @@ word = sys.argv[1] if len(sys.argv) > 1 else "zrobić"
 print(f"Fetching '{word}' from Polish Wiktionary...")
 print("=" * 80)
 
+# Show the parser's debug messages, as the CLI does with -v
+logging.basicConfig(format='%(message)s', stream=sys.stdout)
+logging.getLogger('polishdict').setLevel(logging.DEBUG)
 api = PolishDictionaryAPI(verbose=True)
 data = api.fetch_word(word)
 
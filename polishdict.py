@@ -7,6 +7,7 @@ parts of speech, and other grammatical information in both Polish and English.
 """
 
 import argparse
+import logging
 import sys
 from polishdict.api import PolishDictionaryAPI
 from polishdict.formatter import DictionaryFormatter
@@ -96,6 +97,12 @@ Examples:
         help='Enable verbose debug output'
     )
 
+    parser.add_argument(
+        '--dump-section',
+        metavar='FILE',
+        help='Save the HTML of the Polish Wiktionary section to FILE (debugging)'
+    )
+
     parser.add_argument(
         '--version',
         action='version',
@@ -104,8 +111,13 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.verbose:
+        # Show the parser's debug messages on stdout, where verbose output has always gone
+        logging.basicConfig(format='%(message)s', stream=sys.stdout)
+        logging.getLogger('polishdict').setLevel(logging.DEBUG)
+
     # Initialize API and formatter
-    api = PolishDictionaryAPI(verbose=args.verbose)
+    api = PolishDictionaryAPI(verbose=args.verbose, debug_dump_path=args.dump_section)
     formatter = DictionaryFormatter(use_color=not args.no_color)
 
     try:
@@ -126,9 +138,9 @@ Examples:
         # If in declension mode and we got a form page, automatically look up the lemma
         word_data = check_and_follow_lemma(api, word_data, word_data.get('word', args.word), args.declension, args.verbose)
 
-        # Format and display results
-        output = formatter.format_result(word_data, show_declension=args.declension)
-        print(output)
+        # Format and display results, printing lines as they are formatted
+        for line in formatter.iter_result(word_data, show_declension=args.declension):
+            print(line)
 
     except KeyboardInterrupt:
         print("\n\nLookup cancelled by user.")
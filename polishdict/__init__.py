@@ -4,7 +4,7 @@ A module for looking up Polish words with definitions, parts of speech,
 and grammatical information from Wiktionary.
 """
 
-from .api import PolishDictionaryAPI
+from .api import PolishDictionaryAPI, Definition, get_session
 from .formatter import DictionaryFormatter
 from .search import search_with_fallback
 
@@ -18,7 +18,7 @@ def lookup_word(word, show_declension=False, verbose=False):
     Args:
         word (str): The Polish word to look up
         show_declension (bool): If True, show declension/conjugation tables
-        verbose (bool): If True, print debug information
+        verbose (bool): If True, log debug information to the polishdict.api logger
 
     Returns:
         dict: Dictionary containing word data with keys:
@@ -49,4 +49,5 @@ def format_word_data(word_data, show_declension=False, use_color=True):
     return formatter.format_result(word_data, show_declension=show_declension)
 
 
-__all__ = ['lookup_word', 'format_word_data', 'PolishDictionaryAPI', 'DictionaryFormatter', 'search_with_fallback']
+__all__ = ['lookup_word', 'format_word_data', 'PolishDictionaryAPI', 'Definition', 'DictionaryFormatter', 'search_with_fallback',
+           'get_session']
@@ -3,63 +3,328 @@ Polish Dictionary API Module
 Interfaces with Wiktionary to fetch Polish word definitions and grammatical information
 """
 
+import copy
+import logging
 import requests
+import requests_cache
 import re
-import html
-from html.parser import HTMLParser
-from typing import Dict, List, Optional
-
-
-class SimpleHTMLParser(HTMLParser):
-    """Simple HTML parser to extract text content and structure"""
-
-    def __init__(self):
-        super().__init__()
-        self.elements = []
-        self.current_element = None
-        self.text_buffer = []
-
-    def handle_starttag(self, tag, attrs):
-        # Save previous element if any
-        if self.current_element and self.text_buffer:
-            self.current_element['text'] = ''.join(self.text_buffer).strip()
-            self.text_buffer = []
-
-        # Create new element
-        self.current_element = {
-            'tag': tag,
-            'attrs': dict(attrs),
-            'text': ''
-        }
-        self.elements.append(self.current_element)
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from datetime import timedelta
+from itertools import islice
+from io import BytesIO
+from lxml import etree, html as lxml_html
+from lxml.html import HtmlElement
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from urllib3.response import BaseHTTPResponse
+
+
+logger = logging.getLogger(__name__)
+
+# How long cached Wiktionary responses are reused before being fetched again
+CACHE_EXPIRE_AFTER = timedelta(days=1)
+
+# Keep-alive connections kept open per Wiktionary host
+_POOL_MAXSIZE = 8
+
+# Longest a throttled response's Retry-After header can make a request wait
+_MAX_RETRY_AFTER = 10
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After, but never waits longer than _MAX_RETRY_AFTER"""
+
+    def get_retry_after(self, response: 'BaseHTTPResponse') -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER)
+
+
+def _create_session() -> requests.Session:
+    """Create the HTTP session shared by all Wiktionary requests"""
+    # Responses are persisted in an SQLite file in the user's cache directory,
+    # so repeated lookups (across runs too) skip the network entirely. Expired
+    # responses are revalidated with ETag/Last-Modified when the server sent
+    # them, and still served if Wiktionary can't be reached.
+    session = requests_cache.CachedSession(
+        'polishdict',
+        backend='sqlite',
+        use_cache_dir=True,
+        allowable_methods=['GET'],
+        expire_after=CACHE_EXPIRE_AFTER,
+        stale_if_error=True
+    )
+    session.headers.update({
+        'User-Agent': 'PolishDict/1.0 (Educational Tool)',
+        # gzip/deflate, plus br and zstd when brotli/zstandard are installed
+        'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+    })
+    # Keep connections to *.wiktionary.org alive and retry throttled/5xx
+    # responses, backing off so batch lookups don't hammer Wiktionary. DNS and
+    # connection failures are retried once only, so offline lookups fail fast
+    # (and stale_if_error can serve the cached response straight away).
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=_CappedRetry(
+            total=None,
+            connect=1,
+            read=1,
+            other=1,
+            status=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            # Wait as long as a 429/503 response asks (up to _MAX_RETRY_AFTER)
+            respect_retry_after_header=True
+        )
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+# One session per process, so back-to-back lookups reuse pooled connections.
+# Created on first use, so importing the package doesn't open the cache file.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the HTTP session shared by all PolishDictionaryAPI instances.
+
+    Use it to customise requests made by the library, e.g. to add headers,
+    set proxies or mount a different adapter.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _create_session()
+        return _SESSION
+
+
+# Worker threads for concurrent page fetches, created on demand and reused by
+# every lookup instead of starting new threads per call
+_EXECUTOR = ThreadPoolExecutor(max_workers=_POOL_MAXSIZE, thread_name_prefix='polishdict')
+
+# MediaWiki parse API parameters shared by both Wiktionaries (plus 'page').
+# The disable* flags leave the table of contents, [edit] links and the parser
+# limit report out of the returned HTML, since none of them are used.
+_PARSE_PARAMS = {
+    'action': 'parse',
+    'format': 'json',
+    'formatversion': 2,
+    'prop': 'text',
+    'disabletoc': 1,
+    'disableeditsection': 1,
+    'disablelimitreport': 1,
+    'redirects': 1
+}
+_WIKTIONARY_NAMES = {'pl': 'Polish', 'en': 'English'}
+# Most titles the MediaWiki query API accepts in one titles= request
+_QUERY_BATCH_SIZE = 50
+
+# Regular expressions, compiled once at import time
+
+# Form/redirect pages pointing at their main entry: text directly preceding
+# the link to it, e.g. "zobacz hasło: <a>pies</a>"
+_RE_FORM_PAGE = [
+    re.compile(r'zobacz hasło:?\s*$', re.IGNORECASE),
+    re.compile(r'forma\s+(?:rzeczownika|czasownika|przymiotnika)\s+$', re.IGNORECASE)
+]
+# Part-of-speech keywords: Polish POS paragraphs and English section headings.
+# A single alternation finds the leftmost keyword in one scan. The Polish one
+# is matched against lowercased text, so it always yields the lowercase keyword.
+_RE_POS_KEYWORD_PL = re.compile(
+    r'rzeczownik|czasownik|przymiotnik|przysłówek|zaimek|przyimek|spójnik|wykrzyknik|liczebnik|partykuła|wykrzyknienie'
+)
+_RE_POS_KEYWORD_EN = re.compile(
+    r'Proper noun|Noun|Verb|Adjective|Adverb|Pronoun|Preposition|Conjunction|Interjection|Numeral|Particle'
+)
+# Separators ending the main POS description, e.g. "czasownik dokonany, zobacz też: ..."
+_RE_POS_CORE_SPLIT = re.compile(r'[,;]|zobacz|zobacz też|por\.|zob\.|cf\.')
+# Definition number at the start of a Polish <dd>, e.g. "(1.1)"
+_RE_DEF_NUMBER = re.compile(r'\s*\([0-9.]+\)')
+
+# Lemma references in Polish definitions (e.g., "lm od: pies", "D od: dom")
+_RE_LEMMA_PL = [
+    re.compile(r'(?:lm|lp|D|C|B|Ms|W|N)\s+od:\s+([^\s,;:.]+)', re.IGNORECASE),  # Case abbreviations
+    re.compile(r'forma\s+od:\s+([^\s,;:.]+)', re.IGNORECASE),
+    re.compile(r'czasownika\s+([^\s,;:.]+)', re.IGNORECASE),  # "czasownika być" = of verb być
+    re.compile(r'od:\s+([^\s,;:.]+)', re.IGNORECASE)  # Generic "from: word"
+]
+# Lemma references in English definitions (e.g., "plural of pies", "genitive of dom")
+_RE_LEMMA_EN = [
+    re.compile(r'(?:plural|singular|genitive|dative|accusative|instrumental|locative|vocative)\s+(?:of|form of)\s+([^\s,;:.]+)', re.IGNORECASE),
+    re.compile(r'(?:first|second|third)-person\s+(?:singular|plural)\s+(?:present|past|future|imperative)\s+of\s+([^\s,;:.]+)', re.IGNORECASE),  # Verb conjugations
+    re.compile(r'(?:impersonal|imperfective|perfective)\s+(?:present|past|future|imperative)\s+of\s+([^\s,;:.]+)', re.IGNORECASE),  # Impersonal/aspect forms
+    re.compile(r'inflection of\s+([^\s,;:.]+)', re.IGNORECASE),
+    re.compile(r'form of\s+([^\s,;:.]+)', re.IGNORECASE)
+]
+
+# Text cleanup
+# Citations like [1], [2], [note 1], etc. and [edit] links, removed in one pass.
+# The text before the first digit excludes digits, so a long unclosed "[123..."
+# is rejected in linear time instead of trying every way to split the digits.
+_RE_CITATION_OR_EDIT = re.compile(r'\[[^\]\d]*\d[^\]]*\]|\[edit\]', re.IGNORECASE)
+
+# XPath expressions, compiled once at import time
+# IPA transcriptions inside the Polish "wymowa" field
+_XP_IPA = etree.XPath('.//span[@class="ipa"]')
+# The Polish language heading on English Wiktionary
+_XP_POLISH_H2 = etree.XPath('.//h2[@id="Polish" or .//*[@id="Polish"] or normalize-space()="Polish"]')
+# Polish Wiktionary field markers, e.g. <dt><span data-field="wymowa">
+_XP_DATA_FIELDS = etree.XPath('descendant-or-self::*/@data-field')
+# Table rows, with or without <thead>/<tbody>/<tfoot> wrappers
+_XP_TABLE_ROWS = etree.XPath('./tr|./thead/tr|./tbody/tr|./tfoot/tr')
+
+
+def iter_elements(html: str) -> Iterator[Tuple[str, Dict[str, str], str]]:
+    """
+    Iterate over the elements of an HTML document as they are parsed.
+
+    Yields (tag, attributes, text) tuples, where text is the element's own
+    leading text. Each element is cleared once yielded and its already-yielded
+    preceding siblings are removed from the tree, so memory use stays flat
+    even on large pages.
+    """
+    source = BytesIO(html.encode('utf-8'))
+    for _, element in etree.iterparse(source, events=('end',), html=True, encoding='utf-8'):
+        yield element.tag, dict(element.attrib), (element.text or '').strip()
+        element.clear(keep_tail=True)
+        # Emptied elements otherwise stay attached to their parent
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+@dataclass(frozen=True, slots=True)
+class Definition:
+    """A single definition from a Wiktionary entry"""
+    pos: str
+    definition: str
+    language: str
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access, for callers written against the old dict results"""
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to JSON-serializable dictionary"""
+        return asdict(self)
+
+
+class _ResultCache:
+    """
+    Thread-safe LRU cache of parsed Wiktionary results, keyed by (language, word)
+
+    Entries expire after max_age, like the cached responses they were parsed
+    from. Results are copied on the way in and out, so callers are free to
+    modify the dicts they get back.
+    """
+
+    def __init__(self, maxsize: int, max_age: timedelta):
+        self.maxsize = maxsize
+        self.max_age = max_age.total_seconds()
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[float, Dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[Dict]:
+        """Return the stored result for key, dropping it if expired; call with the lock held"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.max_age:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        with self._lock:
+            return self._lookup(key) is not None
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict]:
+        with self._lock:
+            result = self._lookup(key)
+        return copy.deepcopy(result) if result is not None else None
+
+    def put(self, key: Tuple[str, str], result: Dict) -> None:
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
 
-    def handle_data(self, data):
-        if data.strip():
-            self.text_buffer.append(data)
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
-    def handle_endtag(self, tag):
-        if self.current_element and self.text_buffer:
-            self.current_element['text'] = ''.join(self.text_buffer).strip()
-            self.text_buffer = []
 
-    def get_elements_by_tag(self, tag):
-        """Get all elements with specific tag"""
-        return [el for el in self.elements if el['tag'] == tag]
+# Parsed results shared by all PolishDictionaryAPI instances in this process, so
+# repeated lookups (fallback searches, lemma redirects, the web app) skip parsing.
+# Failed fetches are not cached.
+_RESULT_CACHE = _ResultCache(maxsize=1024, max_age=CACHE_EXPIRE_AFTER)
 
-    def get_text_content(self):
-        """Get all text content"""
-        return ' '.join(el['text'] for el in self.elements if el['text'])
+
+class _VerboseLogger(logging.LoggerAdapter):
+    """Logger for one PolishDictionaryAPI instance, passing on debug messages only if it is verbose"""
+
+    def __init__(self, logger: logging.Logger, verbose: bool):
+        super().__init__(logger, {})
+        self.verbose = verbose
+
+    def isEnabledFor(self, level: int) -> bool:
+        if level <= logging.DEBUG and not self.verbose:
+            return False
+        return super().isEnabledFor(level)
 
 
 class PolishDictionaryAPI:
     """Handles API calls to Wiktionary for Polish word lookups"""
 
-    def __init__(self, verbose=False):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'PolishDict/1.0 (Educational Tool)'
-        })
+    def __init__(self, verbose=False, debug_dump_path: Optional[str] = None):
+        """
+        Args:
+            verbose: If True, log debug information while parsing to the
+                polishdict.api logger (the CLI's -v shows it on stdout)
+            debug_dump_path: If set, write the Polish section of each parsed
+                Polish Wiktionary page to this file
+        """
+        self._session: Optional[requests.Session] = None
         self.verbose = verbose
+        self.debug_dump_path = debug_dump_path
+        # Debug messages go to the polishdict.api logger, for verbose instances only
+        self.logger = _VerboseLogger(logger, verbose)
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session used for Wiktionary requests; the shared get_session() unless replaced"""
+        if self._session is None:
+            self._session = get_session()
+        return self._session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self._session = session
 
     def fetch_word(self, word: str) -> Dict:
         """
@@ -71,72 +336,214 @@ class PolishDictionaryAPI:
         Returns:
             Dictionary containing word data from both sources
         """
+        if self.verbose:
+            # Fetch serially so the debug output of the two parsers doesn't interleave
+            polish_data = self._fetch_polish_wiktionary(word)
+            english_data = self._fetch_english_wiktionary(word)
+        else:
+            # The two requests are independent, so run them concurrently
+            polish_future = _EXECUTOR.submit(self._fetch_polish_wiktionary, word)
+            english_future = _EXECUTOR.submit(self._fetch_english_wiktionary, word)
+            polish_data = polish_future.result()
+            english_data = english_future.result()
+
         result = {
             'word': word,
-            'polish_wiktionary': self._fetch_polish_wiktionary(word),
-            'english_wiktionary': self._fetch_english_wiktionary(word)
+            'polish_wiktionary': polish_data,
+            'english_wiktionary': english_data
         }
         return result
 
-    def _fetch_polish_wiktionary(self, word: str) -> Optional[Dict]:
-        """Fetch data from Polish Wiktionary (pl.wiktionary.org)"""
+    async def fetch_word_async(self, word: str) -> Dict:
+        """
+        Fetch word information without blocking the running event loop
+
+        The two requests run concurrently on the shared worker threads, so
+        async callers can also await many words at once with asyncio.gather.
+
+        Args:
+            word: Polish word to look up
+
+        Returns:
+            Dictionary containing word data from both sources, as fetch_word()
+        """
+        # Imported here: it's already loaded in any program awaiting this, and
+        # importing it at module level would slow down every CLI start
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        polish_data, english_data = await asyncio.gather(
+            loop.run_in_executor(_EXECUTOR, self._fetch_polish_wiktionary, word),
+            loop.run_in_executor(_EXECUTOR, self._fetch_english_wiktionary, word)
+        )
+
+        result = {
+            'word': word,
+            'polish_wiktionary': polish_data,
+            'english_wiktionary': english_data
+        }
+        return result
+
+    def fetch_words(self, words: List[str],
+                    on_result: Optional[Callable[[str, Dict], None]] = None) -> Dict[str, Dict]:
+        """
+        Fetch several words from both Polish and English Wiktionary
+
+        Args:
+            words: Polish words to look up
+            on_result: Optional callback called as on_result(word, result) for
+                each word, in order, as soon as its result is ready
+
+        Returns:
+            Dictionary mapping each word to its fetch_word() result
+        """
+        unique_words = list(dict.fromkeys(words))
+        results = {}
+
+        if self.verbose:
+            for word in unique_words:
+                results[word] = self.fetch_word(word)
+                if on_result:
+                    on_result(word, results[word])
+            return results
+
+        # Ask each Wiktionary which of the pages exist, 50 titles per request,
+        # so words without a page don't cost a parse request of their own. All
+        # checks run at once, and each batch's page requests are submitted as
+        # soon as its check returns; the shared session keeps up to
+        # _POOL_MAXSIZE keep-alive connections per host open for them.
+        fetchers = {'pl': self._fetch_polish_wiktionary, 'en': self._fetch_english_wiktionary}
+        batches = [unique_words[start:start + _QUERY_BATCH_SIZE]
+                   for start in range(0, len(unique_words), _QUERY_BATCH_SIZE)]
+        check_futures = {_EXECUTOR.submit(self._missing_titles, lang, batch): (lang, batch)
+                         for lang in _WIKTIONARY_NAMES for batch in batches}
+        page_futures = {}
+        for check_future in as_completed(check_futures):
+            lang, batch = check_futures[check_future]
+            missing = check_future.result()
+            for word in batch:
+                if word not in missing:
+                    page_futures[lang, word] = _EXECUTOR.submit(fetchers[lang], word)
+
+        futures = [(word, page_futures.get(('pl', word)), page_futures.get(('en', word)))
+                   for word in unique_words]
+        for word, polish_future, english_future in futures:
+            results[word] = {
+                'word': word,
+                'polish_wiktionary': polish_future.result() if polish_future else None,
+                'english_wiktionary': english_future.result() if english_future else None
+            }
+            if on_result:
+                on_result(word, results[word])
+        return results
+
+    def _missing_titles(self, lang: str, words: List[str]) -> Set[str]:
+        """
+        Find which words have no page on the given language's Wiktionary
+
+        Args:
+            lang: Wiktionary language code ('pl' or 'en')
+            words: Page titles to check, at most _QUERY_BATCH_SIZE of them
+
+        Returns:
+            The words known to be missing; words that couldn't be checked
+            are left out, so they are still fetched
+        """
+        # Words already parsed need no request, and '|' separates titles
+        to_check = [word for word in words
+                    if '|' not in word and (lang, word) not in _RESULT_CACHE]
+        if not to_check:
+            return set()
+
         try:
-            # Use MediaWiki API to get page content
-            url = "https://pl.wiktionary.org/w/api.php"
+            url = f"https://{lang}.wiktionary.org/w/api.php"
             params = {
-                'action': 'parse',
-                'page': word,
+                'action': 'query',
+                'titles': '|'.join(to_check),
                 'format': 'json',
-                'prop': 'text|sections',
-                'disabletoc': 1
+                'formatversion': 2,
+                'redirects': 1
             }
 
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            query = response.json()['query']
+        except (requests.RequestException, KeyError):
+            return set()
+
+        # Follow each word through title normalization and redirects
+        normalized = {entry['from']: entry['to'] for entry in query.get('normalized', [])}
+        redirects = {entry['from']: entry['to'] for entry in query.get('redirects', [])}
+        missing_pages = {page['title'] for page in query.get('pages', [])
+                         if page.get('missing') or page.get('invalid')}
+        missing = set()
+        for word in to_check:
+            title = normalized.get(word, word)
+            if redirects.get(title, title) in missing_pages:
+                missing.add(word)
+        return missing
+
+    def clear_cache(self) -> None:
+        """Remove all cached Wiktionary responses and parsed results"""
+        _RESULT_CACHE.clear()
+        # A session swapped in by the caller may not cache responses at all
+        response_cache = getattr(self.session, 'cache', None)
+        if response_cache is not None:
+            response_cache.clear()
 
-            if 'error' in data:
-                return None
+    def _fetch_polish_wiktionary(self, word: str) -> Optional[Dict]:
+        """Fetch data from Polish Wiktionary (pl.wiktionary.org)"""
+        return self._fetch('pl', word, self._parse_polish_wiktionary_html)
 
-            if 'parse' not in data:
-                return None
+    def _fetch_english_wiktionary(self, word: str) -> Optional[Dict]:
+        """Fetch data from English Wiktionary (en.wiktionary.org)"""
+        return self._fetch('en', word, self._parse_english_wiktionary_html)
 
-            html_content = data['parse']['text']['*']
-            return self._parse_polish_wiktionary_html(html_content, word)
+    def _fetch(self, lang: str, word: str, parser: Callable[[str, str], Dict]) -> Optional[Dict]:
+        """
+        Fetch a page from the given language's Wiktionary and parse it
 
-        except Exception as e:
-            print(f"Error fetching from Polish Wiktionary: {e}")
-            return None
+        Args:
+            lang: Wiktionary language code ('pl' or 'en')
+            word: Page title to fetch
+            parser: Parser for the page's rendered HTML
+
+        Returns:
+            Parsed result, or None if the page is missing or the request failed
+        """
+        # Verbose and dump runs parse the page anyway, for their trace and dump file
+        if not (self.verbose or self.debug_dump_path):
+            cached = _RESULT_CACHE.get((lang, word))
+            if cached is not None:
+                return cached
 
-    def _fetch_english_wiktionary(self, word: str) -> Optional[Dict]:
-        """Fetch data from English Wiktionary (en.wiktionary.org)"""
         try:
             # Use MediaWiki API to get page content
-            url = "https://en.wiktionary.org/w/api.php"
-            params = {
-                'action': 'parse',
-                'page': word,
-                'format': 'json',
-                'prop': 'text|sections',
-                'disabletoc': 1
-            }
+            url = f"https://{lang}.wiktionary.org/w/api.php"
+            params = dict(_PARSE_PARAMS, page=word)
 
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
+        except requests.RequestException as e:
+            # Connection errors, HTTP errors left after retrying, invalid JSON
+            self.logger.warning("Error fetching from %s Wiktionary: %s", _WIKTIONARY_NAMES[lang], e)
+            return None
 
-            if 'error' in data:
-                return None
-
-            if 'parse' not in data:
-                return None
+        if 'error' in data:
+            return None
 
-            html_content = data['parse']['text']['*']
-            return self._parse_english_wiktionary_html(html_content, word)
+        if 'parse' not in data:
+            return None
 
-        except Exception as e:
-            print(f"Error fetching from English Wiktionary: {e}")
+        html_content = data['parse']['text']
+        try:
+            result = parser(html_content, word)
+        except Exception:
+            self.logger.exception("Error parsing %s Wiktionary page for '%s'", _WIKTIONARY_NAMES[lang], word)
             return None
+        _RESULT_CACHE.put((lang, word), result)
+        return result
 
     def _parse_polish_wiktionary_html(self, html: str, word: str) -> Dict:
         """Parse HTML from Polish Wiktionary to extract definitions and grammar"""
@@ -150,176 +557,163 @@ class PolishDictionaryAPI:
             'lemma': None  # If this is a form, store the lemma word
         }
 
-        if self.verbose:
-            print(f"[Polish] HTML length: {len(html)}")
+        self.logger.debug("[Polish] HTML length: %s", len(html))
 
-        # Check if this is a form/redirect page (common patterns)
-        form_patterns = [
-            r'zobacz hasło:?\s*<a[^>]*>([^<]+)</a>',
-            r'forma\s+(?:rzeczownika|czasownika|przymiotnika)\s+<a[^>]*>([^<]+)</a>',
-            r'<p[^>]*>\s*forma.*?<a[^>]*>([^<]+)</a>'
-        ]
-
-        for pattern in form_patterns:
-            form_ref = re.search(pattern, html, re.IGNORECASE)
-            if form_ref:
-                lemma = self._strip_html(form_ref.group(1))
-                if self.verbose:
-                    print(f"[Polish] This appears to be a form page, main entry: '{lemma}'")
-                result['lemma'] = lemma  # Store lemma for automatic lookup
-                result['definitions'].append({
-                    'pos': 'forma',
-                    'definition': f'Zobacz hasło: {lemma}',
-                    'language': 'pl'
-                })
-                break
-
-        # Find all headings with their positions
-        heading_matches = list(re.finditer(r'<h[234][^>]*>(.*?)</h[234]>', html, re.IGNORECASE))
+        # Sections of other languages after the Polish one are never read
+        doc = self._parse_document(self._polish_page_head(html))
+        if doc is None:
+            return result
 
-        if self.verbose:
-            print(f"[Polish] Found {len(heading_matches)} headings")
-            for idx, hm in enumerate(heading_matches):
-                h_text = self._strip_html(hm.group(1))
-                print(f"[Polish]   Heading {idx+1}: '{h_text}'")
+        # Check if this is a form/redirect page (common patterns)
+        lemma = self._form_page_lemma(doc)
+        if lemma:
+            self.logger.debug("[Polish] This appears to be a form page, main entry: '%s'", lemma)
+            result['lemma'] = lemma  # Store lemma for automatic lookup
+            result['definitions'].append(Definition(
+                pos='forma',
+                definition=f'Zobacz hasło: {lemma}',
+                language='pl'
+            ))
+
+        # Find all headings in document order, extracting each one's text once
+        headings = list(doc.iter('h2', 'h3', 'h4'))
+        heading_texts = {heading: heading.text_content().strip().lower() for heading in headings}
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("[Polish] Found %s headings", len(headings))
+            for idx, heading in enumerate(headings):
+                self.logger.debug("[Polish]   Heading %s: '%s'", idx+1, heading.text_content())
 
         # First, find the Polish language section
-        polish_section_start = None
-        polish_section_end = None
-
-        for i, match in enumerate(heading_matches):
-            heading_text = self._strip_html(match.group(1)).lower()
+        polish_heading = None
+        for heading in headings:
+            heading_text = heading_texts[heading]
 
             # Look for Polish language section
             if 'język polski' in heading_text or heading_text.endswith('(polski)'):
-                polish_section_start = match.end()
-                # Find the next language section (or end of document)
-                for j in range(i + 1, len(heading_matches)):
-                    next_heading = self._strip_html(heading_matches[j].group(1)).lower()
-                    if 'język' in next_heading or next_heading.count('(') > 0:
-                        polish_section_end = heading_matches[j].start()
-                        break
-                if polish_section_end is None:
-                    polish_section_end = len(html)
+                polish_heading = heading
                 break
 
-        if polish_section_start is None:
-            if self.verbose:
-                print("[Polish] No Polish language section found")
+        if polish_heading is None:
+            self.logger.debug("[Polish] No Polish language section found")
             return result
 
-        if self.verbose:
-            print(f"[Polish] Found Polish section from {polish_section_start} to {polish_section_end}")
+        def is_next_language(heading: HtmlElement) -> bool:
+            heading_text = heading_texts.get(heading)
+            if heading_text is None:  # <h5>/<h6>
+                heading_text = heading.text_content().lower()
+            return 'język' in heading_text or '(' in heading_text
 
-        # Extract only the Polish section
-        polish_section = html[polish_section_start:polish_section_end]
+        # The section runs until the next language heading (or end of document)
+        blocks = self._section_blocks(polish_heading, is_next_language)
+        polish_section = [el for block in blocks for el in block.iter(etree.Element)]
 
-        if self.verbose:
-            print(f"[Polish] Using definition list structure (dl/dt/dd tags)")
+        self.logger.debug("[Polish] Found Polish section with %s top-level elements", len(blocks))
+
+        self.logger.debug("[Polish] Using definition list structure (dl/dt/dd tags)")
+
+        if self.debug_dump_path:
             # Save Polish section to file for debugging
-            with open('/tmp/polish_section_debug.html', 'w', encoding='utf-8') as f:
-                f.write(polish_section)
-            print(f"[Polish] Saved Polish section to /tmp/polish_section_debug.html")
+            with open(self.debug_dump_path, 'w', encoding='utf-8') as f:
+                for block in blocks:
+                    f.write(lxml_html.tostring(block, encoding='unicode'))
+            self.logger.debug("[Polish] Saved Polish section to %s", self.debug_dump_path)
+
+        # Polish Wiktionary uses <dl> structure with data-field attributes;
+        # locate all the field markers in one pass over the section
+        fields = self._index_fields(polish_section)
 
-        # Polish Wiktionary uses <dl> structure with data-field attributes
         # Find pronunciation (wymowa)
-        wymowa_match = re.search(r'<dt[^>]*>.*?data-field="wymowa".*?</dt>\s*<dd>(.*?)</dd>', polish_section, re.DOTALL)
-        if wymowa_match:
-            pron_html = wymowa_match.group(1)
+        wymowa_idx = fields.get('wymowa')
+        wymowa_dd = self._field_value(polish_section, wymowa_idx)
+        if wymowa_dd is not None:
             # Extract IPA
-            ipa_matches = re.findall(r'<span[^>]*class="ipa"[^>]*>(.*?)</span>', pron_html)
-            for ipa in ipa_matches:
-                clean_ipa = self._clean_text(self._strip_html(ipa))
+            for ipa in _XP_IPA(wymowa_dd):
+                clean_ipa = self._clean_text(ipa.text_content())
                 if clean_ipa:
                     result['pronunciation'].append(f"IPA: {clean_ipa}")
-                    if self.verbose:
-                        print(f"[Polish] Found pronunciation: IPA: {clean_ipa}")
+                    self.logger.debug("[Polish] Found pronunciation: IPA: %s", clean_ipa)
 
         # Find etymology (etymologia)
-        etym_match = re.search(r'<dt[^>]*>.*?data-field="etymologia".*?</dt>\s*<dd>(.*?)</dd>', polish_section, re.DOTALL)
-        if etym_match:
-            etym_html = etym_match.group(1)
-            result['etymology'] = self._clean_text(self._strip_html(etym_html))
-            if self.verbose:
-                print(f"[Polish] Found etymology: {result['etymology'][:60]}...")
+        etym_idx = fields.get('etymologia')
+        etym_dd = self._field_value(polish_section, etym_idx)
+        if etym_dd is not None:
+            result['etymology'] = self._clean_text(etym_dd.text_content())
+            self.logger.debug("[Polish] Found etymology: %s...", result['etymology'][:60])
 
         # Find definitions/meanings (znaczenia marker)
         # NOTE: In Polish Wiktionary, the znaczenia <dd> is EMPTY!
         # The actual definitions come AFTER in separate <p> and <dl> blocks
-        znaczenia_pos = re.search(r'<dt[^>]*>.*?data-field="znaczenia".*?</dt>', polish_section)
-        if znaczenia_pos:
-            if self.verbose:
-                print(f"[Polish] Found znaczenia marker at position {znaczenia_pos.end()}")
-
-            # Extract content after znaczenia marker
-            content_after_znaczenia = polish_section[znaczenia_pos.end():]
+        znaczenia_idx = fields.get('znaczenia')
+        if znaczenia_idx is not None:
+            self.logger.debug("[Polish] Found znaczenia marker at element %s", znaczenia_idx)
 
             # Find all <p><i>POS info</i></p> followed by <dl><dd>definitions</dd></dl> blocks
             # Pattern: <p>...rzeczownik...</p> then <dl><dd>(1.1) def...</dd></dl>
-            # Note: Some have nested <i><i>...</i></i> tags, so we match the whole <p>...</p>
-            pos_blocks = re.findall(
-                r'<p>(.*?(?:rzeczownik|czasownik|przymiotnik|przysłówek|zaimek|przyimek|spójnik|wykrzyknik|liczebnik|partykuła|wykrzyknienie).*?)</p>\s*<dl>(.*?)</dl>',
-                content_after_znaczenia,
-                re.DOTALL | re.IGNORECASE
-            )
-
-            if self.verbose:
-                print(f"[Polish] Found {len(pos_blocks)} POS blocks with definitions")
+            # Note: Some have nested <i><i>...</i></i> tags, so we take the text of the whole <p>
+            pos_blocks = []
+            for el in polish_section[znaczenia_idx + 1:]:
+                if el.tag != 'p':
+                    continue
+                definitions_dl = el.getnext()
+                if definitions_dl is None or definitions_dl.tag != 'dl' or (el.tail or '').strip():
+                    continue
+                pos_text = el.text_content()
+                if _RE_POS_KEYWORD_PL.search(pos_text.lower()):
+                    pos_blocks.append((pos_text, definitions_dl))
+
+            self.logger.debug("[Polish] Found %s POS blocks with definitions", len(pos_blocks))
 
             current_def_num = 1  # Track definition numbers
 
-            for pos_text, definitions_html in pos_blocks:
+            for pos_text, definitions_dl in pos_blocks:
                 # Extract POS from the <p><i> text
                 pos_clean = self._clean_text(pos_text).lower()
 
                 # Extract only the main POS description (before "zobacz", commas, semicolons)
                 # This prevents matching aspect/gender from related words
                 # e.g., "czasownik dokonany, zobacz też: robić (ndk)" → "czasownik dokonany"
-                pos_core = re.split(r'[,;]|zobacz|zobacz też|por\.|zob\.|cf\.', pos_clean)[0].strip()
-
-                detected_pos = None
-                pos_patterns = ['rzeczownik', 'czasownik', 'przymiotnik', 'przysłówek',
-                               'zaimek', 'przyimek', 'spójnik', 'wykrzyknik', 'liczebnik',
-                               'partykuła', 'wykrzyknienie']
-                for pos in pos_patterns:
-                    if pos in pos_core:
-                        detected_pos = pos
-                        break
+                pos_core = _RE_POS_CORE_SPLIT.split(pos_clean, 1)[0].strip()
+
+                pos_match = _RE_POS_KEYWORD_PL.search(pos_core)
+                # Interned, so every definition of this POS shares one string
+                detected_pos = sys.intern(pos_match.group(0)) if pos_match else None
 
                 # Extract grammatical properties from core POS text only
                 grammar_props = self._extract_grammar_properties(pos_core, detected_pos)
 
-                if self.verbose:
-                    print(f"[Polish] Processing POS: {detected_pos or pos_core}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("[Polish] Processing POS: %s", detected_pos or pos_core)
                     if grammar_props:
-                        print(f"[Polish] Grammar properties: {grammar_props}")
+                        self.logger.debug("[Polish] Grammar properties: %s", grammar_props)
 
                 # Track the start of this POS block's definitions
                 start_def_num = current_def_num
 
-                # Extract all <dd> items from this block
-                dd_items = re.findall(r'<dd>\s*\([0-9.]+\)(.*?)</dd>', definitions_html, re.DOTALL)
+                # Extract all numbered <dd> items, e.g. <dd>(1.1) ...</dd>, from this block
+                dd_items = []
+                for dd in definitions_dl.findall('dd'):
+                    number_match = _RE_DEF_NUMBER.match(dd.text or '')
+                    if number_match:
+                        dd_items.append(dd.text_content()[number_match.end():])
 
-                if self.verbose:
-                    print(f"[Polish] Found {len(dd_items)} definitions for this POS")
+                self.logger.debug("[Polish] Found %s definitions for this POS", len(dd_items))
 
                 for item in dd_items:
-                    # Remove embedded style/script/link tags first
-                    item = re.sub(r'<style[^>]*>.*?</style>', '', item, flags=re.DOTALL)
-                    item = re.sub(r'<script[^>]*>.*?</script>', '', item, flags=re.DOTALL)
-                    item = re.sub(r'<link[^>]*>', '', item)
+                    # Cleaning never lengthens text, so skip items too short to be kept
+                    if len(item) <= 5:
+                        continue
                     # Clean up the definition
-                    definition = self._clean_text(self._strip_html(item))
+                    definition = self._clean_text(item)
 
                     if definition and len(definition) > 5:
-                        result['definitions'].append({
-                            'pos': detected_pos or 'nieznany',
-                            'definition': definition,
-                            'language': 'pl'
-                        })
+                        result['definitions'].append(Definition(
+                            pos=detected_pos or 'nieznany',
+                            definition=definition,
+                            language='pl'
+                        ))
                         current_def_num += 1
-                        if self.verbose:
-                            print(f"[Polish] Added: {definition[:60]}...")
+                        self.logger.debug("[Polish] Added: %s...", definition[:60])
 
                 # Track this POS block with its definition range
                 if current_def_num > start_def_num:
@@ -332,30 +726,25 @@ class PolishDictionaryAPI:
                     if grammar_props:
                         pos_block_data.update(grammar_props)
                     result['pos_blocks'].append(pos_block_data)
-                    if self.verbose:
-                        print(f"[Polish] POS block '{detected_pos}' has definitions {start_def_num}-{current_def_num - 1}")
-        elif self.verbose:
-            print(f"[Polish] No znaczenia section found at all")
+                    self.logger.debug("[Polish] POS block '%s' has definitions %s-%s", detected_pos, start_def_num, current_def_num - 1)
+        else:
+            self.logger.debug("[Polish] No znaczenia section found at all")
 
         # Find declension tables (odmiana)
-        odmiana_pos = re.search(r'<dt[^>]*>.*?data-field="odmiana".*?</dt>', polish_section)
-        if odmiana_pos:
-            if self.verbose:
-                print(f"[Polish] Found odmiana marker")
-
-            # Extract content after odmiana marker
-            content_after_odmiana = polish_section[odmiana_pos.end():]
+        odmiana_idx = fields.get('odmiana')
+        if odmiana_idx is not None:
+            self.logger.debug("[Polish] Found odmiana marker")
 
             # Find HTML tables in the odmiana section
-            tables = re.findall(r'<table[^>]*class="[^"]*wikitable[^"]*odmiana[^"]*"[^>]*>(.*?)</table>', content_after_odmiana, re.DOTALL)
+            tables = [el for el in polish_section[odmiana_idx + 1:]
+                      if el.tag == 'table' and 'wikitable' in el.get('class', '') and 'odmiana' in el.get('class', '')]
 
-            if self.verbose:
-                print(f"[Polish] Found {len(tables)} declension tables")
+            self.logger.debug("[Polish] Found %s declension tables", len(tables))
 
             # Associate tables with POS blocks based on order
-            for idx, table_html in enumerate(tables):
+            for idx, table in enumerate(tables):
                 # Parse the table
-                table_data = self._parse_html_table(table_html)
+                table_data = self._parse_html_table(table)
                 if table_data:
                     # Associate with POS block if available
                     if idx < len(result['pos_blocks']):
@@ -377,12 +766,12 @@ class PolishDictionaryAPI:
                         if 'animacy' in pos_block:
                             decl_entry['animacy'] = pos_block['animacy']
                         result['declension'].append(decl_entry)
-                        if self.verbose:
-                            print(f"[Polish] {table_type.capitalize()} table {idx+1} associated with definitions {pos_block['start_def']}-{pos_block['end_def']}")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("[Polish] %s table %s associated with definitions %s-%s", table_type.capitalize(), idx+1, pos_block['start_def'], pos_block['end_def'])
                             if 'aspect' in decl_entry:
-                                print(f"[Polish]   Aspect: {decl_entry['aspect']}")
+                                self.logger.debug("[Polish]   Aspect: %s", decl_entry['aspect'])
                             if 'gender' in decl_entry:
-                                print(f"[Polish]   Gender: {decl_entry['gender']}")
+                                self.logger.debug("[Polish]   Gender: %s", decl_entry['gender'])
                     else:
                         # No POS block association available
                         result['declension'].append({
@@ -392,27 +781,23 @@ class PolishDictionaryAPI:
                             'pos': None,
                             'type': 'declension'
                         })
-                    if self.verbose:
-                        print(f"[Polish] Parsed table with {len(table_data)} rows")
+                    self.logger.debug("[Polish] Parsed table with %s rows", len(table_data))
 
         # Check if definitions contain lemma references (e.g., "lm od: pies", "D od: dom")
         if not result['lemma'] and result['definitions']:
             for defn in result['definitions']:
-                definition_text = defn.get('definition', '')
+                definition_text = defn.definition
+                # Every pattern needs "od:" or "czasownika", so most definitions skip the regexes
+                lower_text = definition_text.lower()
+                if 'od:' not in lower_text and 'czasownika' not in lower_text:
+                    continue
                 # Patterns: "lm od: word", "D od: word", "forma od: word", verb conjugations, etc.
-                lemma_patterns = [
-                    r'(?:lm|lp|D|C|B|Ms|W|N)\s+od:\s+([^\s,;:.]+)',  # Case abbreviations
-                    r'forma\s+od:\s+([^\s,;:.]+)',
-                    r'czasownika\s+([^\s,;:.]+)',  # "czasownika być" = of verb być
-                    r'od:\s+([^\s,;:.]+)'  # Generic "from: word"
-                ]
-                for pattern in lemma_patterns:
-                    lemma_match = re.search(pattern, definition_text, re.IGNORECASE)
+                for pattern in _RE_LEMMA_PL:
+                    lemma_match = pattern.search(definition_text)
                     if lemma_match:
                         lemma = lemma_match.group(1).strip()
                         result['lemma'] = lemma
-                        if self.verbose:
-                            print(f"[Polish] Extracted lemma from definition: '{lemma}'")
+                        self.logger.debug("[Polish] Extracted lemma from definition: '%s'", lemma)
                         break
                 if result['lemma']:
                     break
@@ -435,73 +820,65 @@ class PolishDictionaryAPI:
         current_def_num = 1  # Track definition numbers
         current_pos_block = None  # Track current POS being processed
 
-        if self.verbose:
-            print(f"[English] HTML length: {len(html)}")
+        self.logger.debug("[English] HTML length: %s", len(html))
+
+        # Pages without a Polish entry never mention "Polish"; skip building a tree for them
+        if 'Polish' not in html:
+            self.logger.debug("[English] No Polish section found")
+            return result
+
+        # Only the Polish section is needed, so cut it out before building the tree
+        doc = self._parse_document(self._english_polish_section(html))
+        if doc is None:
+            return result
 
         # Find Polish language section - be strict about matching
         # English Wiktionary structure: <h2 id="Polish">Polish</h2>
-        polish_match = re.search(r'<h2[^>]*id="Polish"[^>]*>.*?</h2>', html, re.DOTALL)
-
-        if self.verbose and not polish_match:
-            # Debug: show the actual Polish h2 section
-            polish_h2 = re.search(r'<h2[^>]*id="Polish"[^>]*>.*?</h2>', html, re.DOTALL)
-            if polish_h2:
-                print(f"[English] Found h2 with id='Polish' but pattern didn't match:")
-                print(f"[English] Raw HTML: {polish_h2.group(0)[:200]}")
-            else:
-                print("[English] No h2 with id='Polish' found either")
-
-        # Try alternative pattern - must have "Polish" as the main text in the span
-        if not polish_match:
-            polish_match = re.search(r'<h2[^>]*>\s*<span[^>]*>\s*Polish\s*</span>\s*</h2>', html, re.IGNORECASE)
-
-        if not polish_match:
-            if self.verbose:
+        # (older markup puts the id on a <span class="mw-headline"> inside the <h2>)
+        polish_matches = _XP_POLISH_H2(doc)
+
+        if not polish_matches:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 # Show what h2 sections we found
-                h2_matches = re.findall(r'<h2[^>]*>(.*?)</h2>', html, re.DOTALL)
-                print(f"[English] No Polish section found. Found {len(h2_matches)} h2 sections:")
-                for idx, h2 in enumerate(h2_matches[:10]):
-                    h2_clean = self._strip_html(h2).strip()
-                    print(f"[English]   Section {idx+1}: '{h2_clean}'")
+                h2_headings = list(doc.iter('h2'))
+                self.logger.debug("[English] No Polish section found. Found %s h2 sections:", len(h2_headings))
+                for idx, h2 in enumerate(h2_headings[:10]):
+                    self.logger.debug("[English]   Section %s: '%s'", idx+1, h2.text_content().strip())
             return result
 
-        if self.verbose:
+        polish_heading = polish_matches[0]
+
+        if self.logger.isEnabledFor(logging.DEBUG):
             # Show what section was matched
-            matched_text = self._strip_html(polish_match.group(0)).strip()
-            print(f"[English] Found Polish language section: '{matched_text}'")
+            self.logger.debug("[English] Found Polish language section: '%s'", polish_heading.text_content().strip())
 
         # Get content after Polish heading until next h2
-        polish_start = polish_match.end()
-        next_h2 = re.search(r'<h2[^>]*>', html[polish_start:])
-        polish_end = polish_start + next_h2.start() if next_h2 else len(html)
-        polish_section = html[polish_start:polish_end]
+        blocks = self._section_blocks(polish_heading, lambda heading: heading.tag == 'h2')
+        polish_section = [el for block in blocks for el in block.iter(etree.Element)]
 
-        # Find part of speech sections
-        pos_patterns = ['Noun', 'Proper noun', 'Verb', 'Adjective', 'Adverb', 'Pronoun',
-                       'Preposition', 'Conjunction', 'Interjection', 'Numeral', 'Particle']
+        heading_indices = [idx for idx, el in enumerate(polish_section) if el.tag in ('h3', 'h4', 'h5')]
 
-        heading_matches = list(re.finditer(r'<h[345]([^>]*)>(.*?)</h[345]>', polish_section, re.IGNORECASE))
+        self.logger.debug("[English] Found %s headings in Polish section", len(heading_indices))
 
-        if self.verbose:
-            print(f"[English] Found {len(heading_matches)} headings in Polish section")
+        # Each heading paired with where its section ends: the next heading, or the end
+        section_ends = heading_indices[1:] + [len(polish_section)]
+        for heading_idx, section_end in zip(heading_indices, section_ends):
+            heading_el = polish_section[heading_idx]
+            heading = heading_el.text_content()
 
-        for i, match in enumerate(heading_matches):
-            heading_tag = match.group(1)  # Tag attributes including id
-            heading = self._strip_html(match.group(2))
+            # Elements between this heading and the next one
+            section = polish_section[heading_idx + 1:section_end]
 
-            matched_pos = None
-            for pos in pos_patterns:
-                if pos in heading:
-                    matched_pos = pos
-                    break
+            # Find part of speech sections
+            pos_match = _RE_POS_KEYWORD_EN.search(heading)
+            matched_pos = sys.intern(pos_match.group(0)) if pos_match else None
 
             if matched_pos:
                 # Start a new POS block
                 if current_pos_block:
                     # Save the previous POS block
                     result['pos_blocks'].append(current_pos_block)
-                    if self.verbose:
-                        print(f"[English] Completed POS block '{current_pos_block['pos']}' with definitions {current_pos_block['start_def']}-{current_pos_block['end_def']}")
+                    self.logger.debug("[English] Completed POS block '%s' with definitions %s-%s", current_pos_block['pos'], current_pos_block['start_def'], current_pos_block['end_def'])
 
                 current_pos_block = {
                     'pos': matched_pos,
@@ -510,125 +887,95 @@ class PolishDictionaryAPI:
                     'grammar_info': None  # Will store gender, aspect, diminutive, etc.
                 }
 
-                if self.verbose:
-                    print(f"[English] Found POS: {matched_pos}")
+                self.logger.debug("[English] Found POS: %s", matched_pos)
 
-                # Get section after this heading
-                section_start = match.end()
-                section_end = heading_matches[i + 1].start() if i + 1 < len(heading_matches) else len(polish_section)
-                pos_section = polish_section[section_start:section_end]
+                # Locate the definitions list (and everything before it) in one scan
+                ol_idx = next((idx for idx, el in enumerate(section) if el.tag == 'ol'), len(section))
+                ol = section[ol_idx] if ol_idx < len(section) else None
 
                 # Extract grammatical info line (appears before <ol> but after heading)
                 # Pattern: word followed by grammar markers (m/f/n, pf/impf, diminutive, etc.)
                 # Example: "pies m animal (diminutive piesek, augmentative psisko)"
                 # This typically appears in a <p> tag or <strong> tag before the <ol>
-                before_ol = pos_section.split('<ol', 1)[0]  # Get everything before the definitions list
+                before_ol = section[:ol_idx]
                 # Look for <p><strong>word</strong> ... grammar info ... </p>
-                grammar_pattern = r'<p[^>]*>.*?<strong[^>]*>' + re.escape(word) + r'</strong>\s*(.*?)</p>'
-                grammar_match = re.search(grammar_pattern, before_ol, re.DOTALL | re.IGNORECASE)
-                if grammar_match:
-                    grammar_html = grammar_match.group(1)
-                    # Clean up the grammar info
-                    grammar_html = re.sub(r'<style[^>]*>.*?</style>', '', grammar_html, flags=re.DOTALL)
-                    grammar_html = re.sub(r'<script[^>]*>.*?</script>', '', grammar_html, flags=re.DOTALL)
-                    grammar_html = re.sub(r'<link[^>]*>', '', grammar_html)
-                    grammar_info = self._clean_text(self._strip_html(grammar_html))
-                    if grammar_info and len(grammar_info) > 1:
-                        current_pos_block['grammar_info'] = grammar_info
-                        if self.verbose:
-                            print(f"[English] Found grammar info: {grammar_info}")
+                for p in (el for el in before_ol if el.tag == 'p'):
+                    headword = next((strong for strong in p.iter('strong')
+                                     if len(strong) == 0 and (strong.text or '').lower() == word.lower()), None)
+                    if headword is not None:
+                        grammar_info = self._clean_text(self._text_after(p, headword))
+                        if grammar_info and len(grammar_info) > 1:
+                            current_pos_block['grammar_info'] = grammar_info
+                            self.logger.debug("[English] Found grammar info: %s", grammar_info)
+                        break
 
                 # Extract definitions from ordered list
-                ol_match = re.search(r'<ol[^>]*>(.*?)</ol>', pos_section, re.DOTALL)
-                if ol_match:
-                    list_items = re.findall(r'<li[^>]*>(.*?)</li>', ol_match.group(1), re.DOTALL)
-                    if self.verbose:
-                        print(f"[English] Found {len(list_items)} list items for {matched_pos}")
+                if ol is not None:
+                    list_items = ol.findall('li')
+                    self.logger.debug("[English] Found %s list items for %s", len(list_items), matched_pos)
 
                     for item in list_items:
-                        # Remove embedded style/script/link tags first
-                        item = re.sub(r'<style[^>]*>.*?</style>', '', item, flags=re.DOTALL)
-                        item = re.sub(r'<script[^>]*>.*?</script>', '', item, flags=re.DOTALL)
-                        item = re.sub(r'<link[^>]*>', '', item)
                         # Extract only the main definition (before nested lists or examples)
-                        item = re.sub(r'<[ou]l[^>]*>.*?</[ou]l>', '', item, flags=re.DOTALL)
-                        clean_text = self._clean_text(self._strip_html(item))
+                        item_text = self._text_content(item, skip=('ol', 'ul'))
+                        # Cleaning never lengthens text, so skip items too short to be kept
+                        if len(item_text) <= 5:
+                            continue
+                        clean_text = self._clean_text(item_text)
                         if clean_text and len(clean_text) > 5:
-                            result['definitions'].append({
-                                'pos': matched_pos,
-                                'definition': clean_text,
-                                'language': 'en'
-                            })
+                            result['definitions'].append(Definition(
+                                pos=matched_pos,
+                                definition=clean_text,
+                                language='en'
+                            ))
                             current_pos_block['end_def'] = current_def_num
                             current_def_num += 1
-                            if self.verbose:
-                                print(f"[English] Added definition: {clean_text[:60]}...")
-                elif self.verbose:
-                    print(f"[English] No ordered list found for {matched_pos}")
+                            self.logger.debug("[English] Added definition: %s...", clean_text[:60])
+                else:
+                    self.logger.debug("[English] No ordered list found for %s", matched_pos)
 
             # Check for pronunciation
             elif 'Pronunciation' in heading:
-                if self.verbose:
-                    print("[English] Found pronunciation section")
-                section_start = match.end()
-                section_end = heading_matches[i + 1].start() if i + 1 < len(heading_matches) else len(polish_section)
-                pron_section = polish_section[section_start:section_end]
-                pron_items = re.findall(r'<li[^>]*>(.*?)</li>', pron_section)
-                for item in pron_items[:3]:
-                    # Remove embedded style/script/link tags
-                    item = re.sub(r'<style[^>]*>.*?</style>', '', item, flags=re.DOTALL)
-                    item = re.sub(r'<script[^>]*>.*?</script>', '', item, flags=re.DOTALL)
-                    item = re.sub(r'<link[^>]*>', '', item)
-                    clean_pron = self._clean_text(self._strip_html(item))
+                self.logger.debug("[English] Found pronunciation section")
+                pron_items = (el for el in section if el.tag == 'li')
+                for item in islice(pron_items, 3):
+                    item_text = self._text_content(item, skip=('ol', 'ul'))
+                    if len(item_text) <= 2:
+                        continue
+                    clean_pron = self._clean_text(item_text)
                     if clean_pron and len(clean_pron) > 2:
                         result['pronunciation'].append(clean_pron)
 
             # Check for etymology
             elif 'Etymology' in heading:
-                if self.verbose:
-                    print("[English] Found etymology section")
-                section_start = match.end()
-                section_end = heading_matches[i + 1].start() if i + 1 < len(heading_matches) else len(polish_section)
-                etym_section = polish_section[section_start:section_end]
+                self.logger.debug("[English] Found etymology section")
                 # Get first paragraph after etymology heading
-                p_match = re.search(r'<p[^>]*>(.*?)</p>', etym_section, re.DOTALL)
-                if p_match:
-                    etym_html = p_match.group(1)
-                    # Remove embedded style/script/link tags
-                    etym_html = re.sub(r'<style[^>]*>.*?</style>', '', etym_html, flags=re.DOTALL)
-                    etym_html = re.sub(r'<script[^>]*>.*?</script>', '', etym_html, flags=re.DOTALL)
-                    etym_html = re.sub(r'<link[^>]*>', '', etym_html)
-                    result['etymology'] = self._clean_text(self._strip_html(etym_html))
+                paragraph = next((el for el in section if el.tag == 'p'), None)
+                if paragraph is not None:
+                    result['etymology'] = self._clean_text(paragraph.text_content())
 
             # Check for declension or conjugation
             elif 'Declension' in heading or 'Conjugation' in heading:
                 table_type = 'conjugation' if 'Conjugation' in heading else 'declension'
 
                 # Extract the anchor ID from the heading tag
-                id_match = re.search(r'id="([^"]+)"', heading_tag)
-                if id_match:
-                    anchor_id = id_match.group(1)
+                anchor_id = heading_el.get('id')
+                if anchor_id:
                     if table_type == 'conjugation':
                         result['conjugation_anchor'] = anchor_id
                     else:
                         result['declension_anchor'] = anchor_id
-                    if self.verbose:
-                        print(f"[English] Found {table_type} section with anchor: {anchor_id}")
-                elif self.verbose:
-                    print(f"[English] Found {table_type} section (no anchor found)")
+                    self.logger.debug("[English] Found %s section with anchor: %s", table_type, anchor_id)
+                else:
+                    self.logger.debug("[English] Found %s section (no anchor found)", table_type)
 
-                section_start = match.end()
-                section_end = heading_matches[i + 1].start() if i + 1 < len(heading_matches) else len(polish_section)
-                decl_section = polish_section[section_start:section_end]
+                # Find tables in the declension/conjugation section (skipping nested ones)
+                tables = [el for el in section
+                          if el.tag == 'table' and next(el.iterancestors('table'), None) is None]
+                self.logger.debug("[English] Found %s %s tables", len(tables), table_type)
 
-                # Find tables in the declension/conjugation section
-                tables = re.findall(r'<table[^>]*>(.*?)</table>', decl_section, re.DOTALL)
-                if self.verbose:
-                    print(f"[English] Found {len(tables)} {table_type} tables")
-
-                for table_html in tables:
+                for table in tables:
                     # Parse the table
-                    table_data = self._parse_html_table(table_html)
+                    table_data = self._parse_html_table(table)
                     if table_data:
                         # Associate with the current POS block
                         if current_pos_block:
@@ -639,8 +986,7 @@ class PolishDictionaryAPI:
                                 'pos': current_pos_block['pos'],
                                 'type': table_type
                             })
-                            if self.verbose:
-                                print(f"[English] {table_type.capitalize()} table associated with definitions {current_pos_block['start_def']}-{current_pos_block['end_def']}")
+                            self.logger.debug("[English] %s table associated with definitions %s-%s", table_type.capitalize(), current_pos_block['start_def'], current_pos_block['end_def'])
                         else:
                             # No POS block association
                             result['declension'].append({
@@ -650,41 +996,34 @@ class PolishDictionaryAPI:
                                 'pos': None,
                                 'type': table_type
                             })
-                        if self.verbose:
-                            print(f"[English] Parsed {table_type} table with {len(table_data)} rows")
+                        self.logger.debug("[English] Parsed %s table with %s rows", table_type, len(table_data))
 
         # Save the last POS block if it exists
         if current_pos_block and current_pos_block['end_def'] >= current_pos_block['start_def']:
             result['pos_blocks'].append(current_pos_block)
-            if self.verbose:
-                print(f"[English] Completed POS block '{current_pos_block['pos']}' with definitions {current_pos_block['start_def']}-{current_pos_block['end_def']}")
+            self.logger.debug("[English] Completed POS block '%s' with definitions %s-%s", current_pos_block['pos'], current_pos_block['start_def'], current_pos_block['end_def'])
 
         # Check if definitions contain lemma references (e.g., "plural of pies", "genitive of dom")
         if not result['lemma'] and result['definitions']:
             for defn in result['definitions']:
-                definition_text = defn.get('definition', '')
+                definition_text = defn.definition
+                # Every pattern needs an "of", so most definitions skip the regexes
+                if 'of' not in definition_text.lower():
+                    continue
                 # Patterns: "plural of word", "genitive of word", "inflection of word", verb forms, etc.
-                lemma_patterns = [
-                    r'(?:plural|singular|genitive|dative|accusative|instrumental|locative|vocative)\s+(?:of|form of)\s+([^\s,;:.]+)',
-                    r'(?:first|second|third)-person\s+(?:singular|plural)\s+(?:present|past|future|imperative)\s+of\s+([^\s,;:.]+)',  # Verb conjugations
-                    r'(?:impersonal|imperfective|perfective)\s+(?:present|past|future|imperative)\s+of\s+([^\s,;:.]+)',  # Impersonal/aspect forms
-                    r'inflection of\s+([^\s,;:.]+)',
-                    r'form of\s+([^\s,;:.]+)'
-                ]
-                for pattern in lemma_patterns:
-                    lemma_match = re.search(pattern, definition_text, re.IGNORECASE)
+                for pattern in _RE_LEMMA_EN:
+                    lemma_match = pattern.search(definition_text)
                     if lemma_match:
                         lemma = lemma_match.group(1).strip()
                         result['lemma'] = lemma
-                        if self.verbose:
-                            print(f"[English] Extracted lemma from definition: '{lemma}'")
+                        self.logger.debug("[English] Extracted lemma from definition: '%s'", lemma)
                         break
                 if result['lemma']:
                     break
 
         return result
 
-    def _extract_grammar_properties(self, pos_text: str, pos: str) -> Dict[str, str]:
+    def _extract_grammar_properties(self, pos_text: str, pos: Optional[str]) -> Dict[str, str]:
         """
         Extract grammatical properties from POS block text.
 
@@ -728,46 +1067,159 @@ class PolishDictionaryAPI:
 
         return props
 
-    def _strip_html(self, text: str) -> str:
-        """Remove HTML tags from text"""
-        # Remove all HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        # Decode all HTML entities (&#47;, &#91;, &#93;, &nbsp;, etc.)
-        text = html.unescape(text)
-        return text
-
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text from HTML"""
-        # Remove citations like [1], [2], [note 1], etc.
-        text = re.sub(r'\[[^\]]*\d+[^\]]*\]', '', text)
-        # Remove edit links
-        text = re.sub(r'\[edit\]', '', text, flags=re.IGNORECASE)
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        # Remove leading/trailing whitespace
-        text = text.strip()
-        return text
-
-    def _parse_html_table(self, table_html: str) -> List[List[str]]:
-        """Parse an HTML table into a list of rows"""
+        # Remove citations like [1], [2], [note 1], etc. and edit links
+        # (most text has no brackets at all, so skip the regex for it)
+        if '[' in text:
+            text = _RE_CITATION_OR_EDIT.sub('', text)
+        # Collapse runs of whitespace and trim both ends in one split/join
+        return ' '.join(text.split())
+
+    def _parse_document(self, html: str) -> Optional[HtmlElement]:
+        """Parse an HTML fragment into an lxml tree, without <script>/<style> elements"""
+        if not html or not html.strip():
+            return None
+        doc = lxml_html.fromstring(html)
+        # Embedded styles and scripts never carry dictionary content
+        etree.strip_elements(doc, 'script', 'style', with_tail=False)
+        return doc
+
+    def _form_page_lemma(self, doc: HtmlElement) -> Optional[str]:
+        """Find the main entry a Polish form/redirect page links to, if any"""
+        # Only plain-text links can name the main entry
+        links = [a for a in doc.iter('a') if len(a) == 0 and a.text]
+
+        # "zobacz hasło: <a>pies</a>", then "forma rzeczownika <a>pies</a>"
+        for pattern in _RE_FORM_PAGE:
+            for link in links:
+                previous = link.getprevious()
+                text_before = previous.tail if previous is not None else link.getparent().text
+                if text_before and pattern.search(text_before):
+                    return link.text
+
+        # "<p>forma ... <a>pies</a></p>": first link of a paragraph opening with "forma"
+        for paragraph in doc.iter('p'):
+            if (paragraph.text or '').lstrip().lower().startswith('forma'):
+                link = next((a for a in paragraph.iter('a') if len(a) == 0 and a.text), None)
+                if link is not None:
+                    return link.text
+
+        return None
+
+    def _polish_page_head(self, html: str) -> str:
+        """
+        Cut a Polish Wiktionary page off after its język polski section.
+
+        Uses plain substring search for the <h2 id="..._(język_polski)">
+        heading and the next <h2>. Returns the whole page if the heading
+        can't be located this way.
+        """
+        anchor = html.find('_(język_polski)"')
+        if anchor < 0:
+            return html
+        heading_end = html.find('</h2>', anchor)
+        if heading_end < 0:
+            return html
+        end = html.find('<h2', heading_end)
+        return html[:end] if end >= 0 else html
+
+    def _english_polish_section(self, html: str) -> str:
+        """
+        Cut the Polish language section out of an English Wiktionary page.
+
+        Uses plain substring search for the <h2 id="Polish"> heading and the
+        next <h2>. Returns the whole page if the heading can't be located
+        this way, leaving it to the parser to look more thoroughly.
+        """
+        anchor = html.find('id="Polish"')
+        if anchor < 0:
+            return html
+        start = html.rfind('<h2', 0, anchor)
+        if start < 0:
+            return html
+        heading_end = html.find('</h2>', anchor)
+        if heading_end < 0:
+            return html
+        end = html.find('<h2', heading_end)
+        return html[start:end] if end >= 0 else html[start:]
+
+    def _section_blocks(self, heading: HtmlElement,
+                        is_end: Callable[[HtmlElement], bool]) -> List[HtmlElement]:
+        """
+        Collect the top-level elements that follow a section heading.
+
+        Args:
+            heading: The <h2>/<h3>/... element opening the section
+            is_end: Predicate called on later headings; the section stops at
+                    the first element containing a heading it accepts
+
+        Returns:
+            List of sibling elements making up the section
+        """
+        # Newer MediaWiki output wraps headings in <div class="mw-heading">
+        start = heading
+        parent = heading.getparent()
+        if parent is not None and 'mw-heading' in parent.get('class', ''):
+            start = parent
+
+        blocks = []
+        for block in start.itersiblings():
+            if any(is_end(h) for h in block.iter('h2', 'h3', 'h4', 'h5', 'h6')):
+                break
+            blocks.append(block)
+        return blocks
+
+    def _index_fields(self, section: List[HtmlElement]) -> Dict[str, int]:
+        """Map each data-field name to the index of the first <dt> marking it in a flattened section"""
+        fields: Dict[str, int] = {}
+        for idx, el in enumerate(section):
+            if el.tag == 'dt':
+                for field in _XP_DATA_FIELDS(el):
+                    fields.setdefault(str(field), idx)
+        return fields
+
+    def _field_value(self, section: List[HtmlElement], idx: Optional[int]) -> Optional[HtmlElement]:
+        """Return the <dd> directly following the <dt> at section[idx], if any"""
+        if idx is None:
+            return None
+        dd = section[idx].getnext()
+        if dd is None or dd.tag != 'dd':
+            return None
+        return dd
+
+    def _text_content(self, element: HtmlElement, skip: Tuple[str, ...] = ()) -> str:
+        """Get the text of an element, leaving out descendants whose tag is in skip"""
+        if not skip:
+            return element.text_content()
+        parts = [element.text or '']
+        for child in element:
+            if isinstance(child.tag, str) and child.tag not in skip:
+                parts.append(self._text_content(child, skip))
+            parts.append(child.tail or '')
+        return ''.join(parts)
+
+    def _text_after(self, container: HtmlElement, marker: HtmlElement) -> str:
+        """Get the text of container that follows the marker element"""
+        parts = []
+        node = marker
+        while node is not None and node is not container:
+            parts.append(node.tail or '')
+            for sibling in node.itersiblings():
+                if isinstance(sibling.tag, str):
+                    parts.append(sibling.text_content())
+                parts.append(sibling.tail or '')
+            node = node.getparent()
+        return ''.join(parts)
+
+    def _parse_html_table(self, table: HtmlElement) -> List[List[str]]:
+        """Parse an HTML table element into a list of rows"""
         rows = []
 
-        # Find all table rows
-        tr_matches = re.findall(r'<tr[^>]*>(.*?)</tr>', table_html, re.DOTALL)
-
-        for tr in tr_matches:
-            row = []
-            # Find all cells (both th and td)
-            cells = re.findall(r'<t[hd][^>]*>(.*?)</t[hd]>', tr, re.DOTALL)
-
-            for cell in cells:
-                # Remove style/script/link tags
-                cell = re.sub(r'<style[^>]*>.*?</style>', '', cell, flags=re.DOTALL)
-                cell = re.sub(r'<script[^>]*>.*?</script>', '', cell, flags=re.DOTALL)
-                cell = re.sub(r'<link[^>]*>', '', cell)
-                # Clean the cell content
-                cell_text = self._clean_text(self._strip_html(cell))
-                row.append(cell_text)
+        # Find the table's own rows (not those of nested tables)
+        for tr in _XP_TABLE_ROWS(table):
+            # Collect all cells (both th and td)
+            row = [self._clean_text(cell.text_content()) for cell in tr if cell.tag in ('th', 'td')]
 
             if row:  # Only add non-empty rows
                 rows.append(row)
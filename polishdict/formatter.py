@@ -3,13 +3,75 @@ Output Formatter Module
 Formats dictionary results for terminal display
 """
 
-from typing import Dict, List
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, TypedDict, Union
 from urllib.parse import quote
 from colorama import Fore, Style, init
 
+if TYPE_CHECKING:
+    from .api import Definition
+
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+# Readable labels for Polish part-of-speech names
+_POS_MAPPING = {
+    'rzeczownik': 'Noun (rzeczownik)',
+    'czasownik': 'Verb (czasownik)',
+    'przymiotnik': 'Adjective (przymiotnik)',
+    'przysłówek': 'Adverb (przysłówek)',
+    'zaimek': 'Pronoun (zaimek)',
+    'przyimek': 'Preposition (przyimek)',
+    'spójnik': 'Conjunction (spójnik)',
+    'wykrzyknik': 'Interjection (wykrzyknik)',
+    'liczebnik': 'Numeral (liczebnik)'
+}
+
+class _SectionLabels(TypedDict):
+    """Labels and link settings for one Wiktionary's section of the output"""
+    title: str
+    wiki: str
+    anchor: Optional[str]  # Page anchor for definitions; tables link to the page's declension anchor
+    tables_both: str
+    tables_conjugation: str
+    tables_declension: str
+    conjugation: str
+    declension: str
+    one_definition: str
+    definition_range: str
+    table: str
+
+
+# Per-source labels for format_result, in display order
+_SECTIONS: List[Tuple[str, _SectionLabels]] = [
+    ('polish_wiktionary', {
+        'title': "=== POLISH (Polski) ===",
+        'wiki': 'pl',
+        'anchor': None,
+        'tables_both': "Odmiana (Declension/Conjugation):",
+        'tables_conjugation': "Odmiana (Conjugation):",
+        'tables_declension': "Odmiana (Declension):",
+        'conjugation': "koniugacja",
+        'declension': "odmiana",
+        'one_definition': "Dla definicji {start}",
+        'definition_range': "Dla definicji {start}-{end}",
+        'table': "Tabela {number}",
+    }),
+    ('english_wiktionary', {
+        'title': "=== ENGLISH ===",
+        'wiki': 'en',
+        'anchor': 'Polish',
+        'tables_both': "Declension/Conjugation:",
+        'tables_conjugation': "Conjugation:",
+        'tables_declension': "Declension:",
+        'conjugation': "conjugation",
+        'declension': "declension",
+        'one_definition': "For definition {start}",
+        'definition_range': "For definitions {start}-{end}",
+        'table': "Table {number}",
+    }),
+]
+
 
 class DictionaryFormatter:
     """Formats dictionary lookup results for terminal output"""
@@ -28,177 +90,123 @@ class DictionaryFormatter:
         Returns:
             Formatted string ready for display
         """
-        output = []
-
-        word = word_data.get('word', 'Unknown')
-        display_word = word_data.get('display_word', word)  # Use display_word for header if available
-        output.append(self._format_header(display_word))
-        output.append("")
-
-        # Process Polish Wiktionary data
-        polish_data = word_data.get('polish_wiktionary')
-        if polish_data and (polish_data.get('definitions') or
-                           polish_data.get('etymology') or
-                           polish_data.get('pronunciation') or
-                           polish_data.get('declension')):
-            output.append(self._colorize("=== POLISH (Polski) ===", Fore.CYAN, bold=True))
-            output.append("")
-
-            if show_declension:
-                # Show declension/conjugation tables
-                if polish_data.get('declension'):
-                    # Determine if we have conjugations or declensions
-                    has_conjugation = any(t.get('type') == 'conjugation' for t in polish_data['declension'])
-                    has_declension = any(t.get('type') == 'declension' for t in polish_data['declension'])
-
-                    if has_conjugation and has_declension:
-                        output.append(self._colorize("Odmiana (Declension/Conjugation):", Fore.YELLOW))
-                    elif has_conjugation:
-                        output.append(self._colorize("Odmiana (Conjugation):", Fore.YELLOW))
-                    else:
-                        output.append(self._colorize("Odmiana (Declension):", Fore.YELLOW))
-                    output.append("")
-
-                    for idx, table_info in enumerate(polish_data['declension']):
-                        # Show which definitions this table applies to
-                        table_type_label = "koniugacja" if table_info.get('type') == 'conjugation' else "odmiana"
-                        if table_info.get('start_def') and table_info.get('end_def'):
-                            if table_info['start_def'] == table_info['end_def']:
-                                def_range = f"Dla definicji {table_info['start_def']}"
-                            else:
-                                def_range = f"Dla definicji {table_info['start_def']}-{table_info['end_def']}"
-
-                            if table_info.get('pos'):
-                                output.append(self._colorize(f"{def_range} ({table_info['pos']} - {table_type_label}):", Fore.GREEN))
-                            else:
-                                output.append(self._colorize(f"{def_range} ({table_type_label}):", Fore.GREEN))
-                        else:
-                            output.append(self._colorize(f"Tabela {idx + 1} ({table_type_label}):", Fore.GREEN))
+        return "\n".join(self.iter_result(word_data, show_declension=show_declension))
 
-                        output.extend(self._format_table(table_info['table']))
-                        output.append("")
-                else:
-                    output.append("No declension/conjugation tables found.")
-                    output.append("")
-            else:
-                # Show definitions (default behavior)
-                if polish_data.get('pronunciation'):
-                    output.append(self._colorize("Pronunciation:", Fore.YELLOW))
-                    for pron in polish_data['pronunciation']:
-                        output.append(f"  • {pron}")
-                    output.append("")
-
-                if polish_data.get('etymology'):
-                    output.append(self._colorize("Etymology:", Fore.YELLOW))
-                    output.append(f"  {polish_data['etymology']}")
-                    output.append("")
+    def iter_result(self, word_data: Dict, show_declension: bool = False) -> Iterator[str]:
+        """
+        Format the complete word lookup result line by line
 
-                if polish_data.get('definitions'):
-                    output.append(self._colorize("Definitions:", Fore.YELLOW))
-                    output.extend(self._format_definitions(polish_data['definitions']))
-                    output.append("")
+        Same output as format_result(), without building the whole text first.
 
-            # Add URL to Polish Wiktionary page
-            polish_url = f"https://pl.wiktionary.org/wiki/{quote(word)}"
-            output.append(self._colorize(f"More: {polish_url}", Fore.BLUE))
-            output.append("")
-
-        # Process English Wiktionary data
-        english_data = word_data.get('english_wiktionary')
-        if english_data and (english_data.get('definitions') or
-                            english_data.get('etymology') or
-                            english_data.get('pronunciation') or
-                            english_data.get('declension')):
-            output.append(self._colorize("=== ENGLISH ===", Fore.CYAN, bold=True))
-            output.append("")
-
-            if show_declension:
-                # Show declension/conjugation tables
-                if english_data.get('declension'):
-                    # Determine if we have conjugations or declensions
-                    has_conjugation = any(t.get('type') == 'conjugation' for t in english_data['declension'])
-                    has_declension = any(t.get('type') == 'declension' for t in english_data['declension'])
-
-                    if has_conjugation and has_declension:
-                        output.append(self._colorize("Declension/Conjugation:", Fore.YELLOW))
-                    elif has_conjugation:
-                        output.append(self._colorize("Conjugation:", Fore.YELLOW))
-                    else:
-                        output.append(self._colorize("Declension:", Fore.YELLOW))
-                    output.append("")
+        Args:
+            word_data: Dictionary containing word information
+            show_declension: If True, show declension tables instead of definitions
 
-                    for idx, table_info in enumerate(english_data['declension']):
-                        # Show which definitions this table applies to
-                        table_type_label = table_info.get('type', 'declension')
-                        if table_info.get('start_def') and table_info.get('end_def'):
-                            if table_info['start_def'] == table_info['end_def']:
-                                def_range = f"For definition {table_info['start_def']}"
-                            else:
-                                def_range = f"For definitions {table_info['start_def']}-{table_info['end_def']}"
-
-                            if table_info.get('pos'):
-                                output.append(self._colorize(f"{def_range} ({table_info['pos']} - {table_type_label}):", Fore.GREEN))
-                            else:
-                                output.append(self._colorize(f"{def_range} ({table_type_label}):", Fore.GREEN))
-                        else:
-                            output.append(self._colorize(f"Table {idx + 1} ({table_type_label}):", Fore.GREEN))
+        Yields:
+            Formatted lines, without trailing newlines
+        """
+        word = word_data.get('word', 'Unknown')
+        display_word = word_data.get('display_word', word)  # Use display_word for header if available
+        quoted_word = quote(word)  # URL path segment, shared by both Wiktionary links
+        yield self._format_header(display_word)
+        yield ""
+
+        # Process Polish, then English Wiktionary data
+        for key, labels in _SECTIONS:
+            data = word_data.get(key)
+            if data and (data.get('definitions') or
+                         data.get('etymology') or
+                         data.get('pronunciation') or
+                         data.get('declension')):
+                yield from self._format_section(data, labels, quoted_word, show_declension)
 
-                        output.extend(self._format_table(table_info['table']))
-                        output.append("")
+        # Check if no results found
+        if not any(word_data.get(key) and word_data[key].get('definitions') for key, _ in _SECTIONS):
+            yield self._colorize("No definitions found for this word.", Fore.RED)
+            yield ""
+            yield "This could mean:"
+            yield "  • The word doesn't exist in Wiktionary"
+            yield "  • It might be misspelled"
+            yield "  • It might be a very rare or archaic term"
+
+    def _format_section(self, data: Dict, labels: _SectionLabels, quoted_word: str,
+                        show_declension: bool) -> Iterator[str]:
+        """Format the results from one Wiktionary line by line, labelled as given in _SECTIONS"""
+        yield self._colorize(labels['title'], Fore.CYAN, bold=True)
+        yield ""
+
+        if show_declension:
+            # Show declension/conjugation tables
+            if data.get('declension'):
+                # Determine if we have conjugations or declensions
+                has_conjugation = any(t.get('type') == 'conjugation' for t in data['declension'])
+                has_declension = any(t.get('type') == 'declension' for t in data['declension'])
+
+                if has_conjugation and has_declension:
+                    yield self._colorize(labels['tables_both'], Fore.YELLOW)
+                elif has_conjugation:
+                    yield self._colorize(labels['tables_conjugation'], Fore.YELLOW)
                 else:
-                    output.append("No declension/conjugation tables found.")
-                    output.append("")
-            else:
-                # Show definitions (default behavior)
-                if english_data.get('pronunciation'):
-                    output.append(self._colorize("Pronunciation:", Fore.YELLOW))
-                    for pron in english_data['pronunciation']:
-                        output.append(f"  • {pron}")
-                    output.append("")
-
-                if english_data.get('etymology'):
-                    output.append(self._colorize("Etymology:", Fore.YELLOW))
-                    output.append(f"  {english_data['etymology']}")
-                    output.append("")
-
-                if english_data.get('definitions'):
-                    output.append(self._colorize("Definitions:", Fore.YELLOW))
-                    output.extend(self._format_definitions(english_data['definitions'], english_data.get('pos_blocks', [])))
-                    output.append("")
+                    yield self._colorize(labels['tables_declension'], Fore.YELLOW)
+                yield ""
+
+                for idx, table_info in enumerate(data['declension']):
+                    # Show which definitions this table applies to
+                    table_type_label = labels['conjugation'] if table_info.get('type') == 'conjugation' else labels['declension']
+                    if table_info.get('start_def') and table_info.get('end_def'):
+                        if table_info['start_def'] == table_info['end_def']:
+                            def_range = labels['one_definition'].format(start=table_info['start_def'])
+                        else:
+                            def_range = labels['definition_range'].format(start=table_info['start_def'], end=table_info['end_def'])
 
-                if english_data.get('grammar'):
-                    output.append(self._colorize("Grammar Information:", Fore.YELLOW))
-                    for pos, grammar in english_data['grammar'].items():
-                        output.append(f"  [{pos}] {grammar}")
-                    output.append("")
+                        if table_info.get('pos'):
+                            yield self._colorize(f"{def_range} ({table_info['pos']} - {table_type_label}):", Fore.GREEN)
+                        else:
+                            yield self._colorize(f"{def_range} ({table_type_label}):", Fore.GREEN)
+                    else:
+                        table_label = labels['table'].format(number=idx + 1)
+                        yield self._colorize(f"{table_label} ({table_type_label}):", Fore.GREEN)
 
-            # Add URL to English Wiktionary page with smart anchor
-            if show_declension:
-                # In declension mode, try to link to the specific section
-                if english_data.get('conjugation_anchor') or english_data.get('declension_anchor'):
-                    # Use extracted anchor (e.g., Declension_2, Conjugation)
-                    anchor = english_data.get('conjugation_anchor') or english_data.get('declension_anchor')
-                    english_url = f"https://en.wiktionary.org/wiki/{quote(word)}#{anchor}"
-                else:
-                    # Fallback to generic #Declension anchor
-                    english_url = f"https://en.wiktionary.org/wiki/{quote(word)}#Declension"
+                    yield from self._format_table(table_info['table'])
+                    yield ""
             else:
-                # Default to Polish section anchor
-                english_url = f"https://en.wiktionary.org/wiki/{quote(word)}#Polish"
-            output.append(self._colorize(f"More: {english_url}", Fore.BLUE))
-            output.append("")
-
-        # Check if no results found
-        if not (polish_data and polish_data.get('definitions')) and \
-           not (english_data and english_data.get('definitions')):
-            output.append(self._colorize("No definitions found for this word.", Fore.RED))
-            output.append("")
-            output.append("This could mean:")
-            output.append("  • The word doesn't exist in Wiktionary")
-            output.append("  • It might be misspelled")
-            output.append("  • It might be a very rare or archaic term")
-
-        return "\n".join(output)
+                yield "No declension/conjugation tables found."
+                yield ""
+        else:
+            # Show definitions (default behavior)
+            if data.get('pronunciation'):
+                yield self._colorize("Pronunciation:", Fore.YELLOW)
+                for pron in data['pronunciation']:
+                    yield f"  • {pron}"
+                yield ""
+
+            if data.get('etymology'):
+                yield self._colorize("Etymology:", Fore.YELLOW)
+                yield f"  {data['etymology']}"
+                yield ""
+
+            if data.get('definitions'):
+                yield self._colorize("Definitions:", Fore.YELLOW)
+                yield from self._format_definitions(data['definitions'], data.get('pos_blocks', []))
+                yield ""
+
+            if data.get('grammar'):
+                yield self._colorize("Grammar Information:", Fore.YELLOW)
+                for pos, grammar in data['grammar'].items():
+                    yield f"  [{pos}] {grammar}"
+                yield ""
+
+        # Add URL to the Wiktionary page, with a smart anchor where the page has one
+        anchor = labels['anchor']
+        if anchor and show_declension:
+            # In declension mode, try to link to the specific section (e.g., Declension_2,
+            # Conjugation), falling back to the generic #Declension anchor
+            anchor = data.get('conjugation_anchor') or data.get('declension_anchor') or 'Declension'
+        url = f"https://{labels['wiki']}.wiktionary.org/wiki/{quoted_word}"
+        if anchor:
+            url += f"#{anchor}"
+        yield self._colorize(f"More: {url}", Fore.BLUE)
+        yield ""
 
     def _format_header(self, word: str) -> str:
         """Format the word header"""
@@ -210,7 +218,7 @@ class DictionaryFormatter:
             return f"{Fore.GREEN}{Style.BRIGHT}{header}\n{title}\n{footer}{Style.RESET_ALL}"
         return f"{header}\n{title}\n{footer}"
 
-    def _format_definitions(self, definitions: List[Dict], pos_blocks: List[Dict] = None) -> List[str]:
+    def _format_definitions(self, definitions: List[Union['Definition', Dict]], pos_blocks: List[Dict] = None) -> List[str]:
         """Format a list of definitions"""
         output = []
         current_pos = None
@@ -225,6 +233,7 @@ class DictionaryFormatter:
                     grammar_info_map[block['pos']] = block['grammar_info']
 
         for defn in definitions:
+            # Definition objects and plain dicts (e.g. JSON from the web app) both support .get()
             pos = defn.get('pos', 'Unknown')
             definition = defn.get('definition', '')
             global_def_count += 1
@@ -249,32 +258,18 @@ class DictionaryFormatter:
 
     def _format_pos(self, pos: str) -> str:
         """Format part of speech labels"""
-        # Convert Polish POS to more readable format
-        pos_mapping = {
-            'rzeczownik': 'Noun (rzeczownik)',
-            'czasownik': 'Verb (czasownik)',
-            'przymiotnik': 'Adjective (przymiotnik)',
-            'przysłówek': 'Adverb (przysłówek)',
-            'zaimek': 'Pronoun (zaimek)',
-            'przyimek': 'Preposition (przyimek)',
-            'spójnik': 'Conjunction (spójnik)',
-            'wykrzyknik': 'Interjection (wykrzyknik)',
-            'liczebnik': 'Numeral (liczebnik)'
-        }
-
-        pos_lower = pos.lower().strip()
-        return pos_mapping.get(pos_lower, pos)
+        # Convert Polish POS to more readable format; parser output is already
+        # a clean lowercase keyword, so try it as-is before normalizing
+        return _POS_MAPPING.get(pos) or _POS_MAPPING.get(pos.lower().strip(), pos)
 
     def _colorize(self, text: str, color: str, bold: bool = False) -> str:
         """Apply color to text if colors are enabled"""
         if not self.use_color:
             return text
 
-        result = color + text
         if bold:
-            result = Style.BRIGHT + result
-        result += Style.RESET_ALL
-        return result
+            return f"{Style.BRIGHT}{color}{text}{Style.RESET_ALL}"
+        return f"{color}{text}{Style.RESET_ALL}"
 
     def _format_table(self, table_data: List[List[str]]) -> List[str]:
         """Format a table for terminal display with proper column alignment"""
@@ -283,35 +278,20 @@ class DictionaryFormatter:
 
         output = []
 
-        # Calculate column widths
-        col_widths = []
-        num_cols = max(len(row) for row in table_data)
-
-        for col_idx in range(num_cols):
-            max_width = 0
-            for row in table_data:
-                if col_idx < len(row):
-                    # Strip ANSI color codes for width calculation
-                    cell_text = row[col_idx]
-                    max_width = max(max_width, len(cell_text))
-            col_widths.append(max_width)
+        # Calculate column widths (short rows are padded with empty cells)
+        col_widths = [max(map(len, column)) for column in zip_longest(*table_data, fillvalue='')]
 
         # Format each row
         for row_idx, row in enumerate(table_data):
-            formatted_cells = []
-            for col_idx, cell in enumerate(row):
-                width = col_widths[col_idx]
-                # Pad cell to column width
-                padded_cell = cell.ljust(width)
+            # Pad cells to column width
+            padded_cells = [cell.ljust(width) for cell, width in zip(row, col_widths)]
 
-                # Colorize header row (first row)
-                if row_idx == 0:
-                    padded_cell = self._colorize(padded_cell, Fore.CYAN, bold=True)
-
-                formatted_cells.append(padded_cell)
+            # Colorize header row (first row)
+            if row_idx == 0:
+                padded_cells = [self._colorize(cell, Fore.CYAN, bold=True) for cell in padded_cells]
 
             # Join cells with separator
-            row_str = "  │ " + " │ ".join(formatted_cells) + " │"
+            row_str = "  │ " + " │ ".join(padded_cells) + " │"
             output.append(row_str)
 
             # Add separator after header row
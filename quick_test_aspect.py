@@ -4,6 +4,7 @@ Quick test to show what aspect is extracted for a word
 Run this and share the output
 """
 
+import logging
 import sys
 from polishdict.api import PolishDictionaryAPI
 from polishdict.morphology import MorphologyParser
@@ -14,6 +15,9 @@ print(f"\n{'='*80}")
 print(f"Testing: {word}")
 print(f"{'='*80}\n")
 
+# Show the parser's debug messages, as the CLI does with -v
+logging.basicConfig(format='%(message)s', stream=sys.stdout)
+logging.getLogger('polishdict').setLevel(logging.DEBUG)
 api = PolishDictionaryAPI(verbose=True)
 data = api.fetch_word(word)
 
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Test detection of Polish Wiktionary form pages (offline HTML fixtures)"""
+
+from polishdict.api import PolishDictionaryAPI
+
+api = PolishDictionaryAPI()
+
+HEADING = '<h2 id="psa_(język_polski)">psa (<a href="/wiki/j%C4%99zyk_polski">język polski</a>)</h2>'
+
+test_cases = [
+    # (description, html, expected_lemma)
+    ("'zobacz hasło:' link",
+     HEADING + '<p>zobacz hasło: <a href="/wiki/pies">pies</a></p>',
+     "pies"),
+    ("'zobacz hasło' without colon, upper case, entity in link",
+     HEADING + '<p>ZOBACZ HASŁO <a href="/wiki/w%C3%B3z">w&oacute;z</a> i <a>inne</a></p>',
+     "wóz"),
+    ("'forma rzeczownika' link",
+     HEADING + '<dl><dd>forma rzeczownika <a href="/wiki/dom">dom</a></dd></dl>',
+     "dom"),
+    ("'forma czasownika' split across lines",
+     HEADING + '<p>x</p>forma czasownika\n <a class="q">iść</a>',
+     "iść"),
+    ("<p> opening with 'forma'",
+     HEADING + '<p>forma fleksyjna od <a href="/wiki/kot">kot</a></p>',
+     "kot"),
+    ("<p> opening with 'Forma', first plain-text link",
+     HEADING + '<p> Forma <i>x</i> <a><b>y</b></a> <a>ryba &amp; co</a></p>',
+     "ryba & co"),
+    ("Ordinary entry, no form markers",
+     HEADING + '<p>rzeczownik, rodzaj męski</p><p>inne <a href="/wiki/z">z</a></p>',
+     None),
+]
+
+print("Testing form page detection:")
+print("=" * 80)
+
+for description, html, expected_lemma in test_cases:
+    result = api._parse_polish_wiktionary_html(html, 'psa')
+    actual_lemma = result['lemma']
+
+    status = "✓" if actual_lemma == expected_lemma else "✗"
+    print(f"{status} {description}")
+    print(f"   Expected: {expected_lemma!r}, Got: {actual_lemma!r}")
+    print()
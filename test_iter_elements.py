@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test streaming iteration over HTML elements (offline HTML fixtures)"""
+
+from lxml import etree
+
+import polishdict.api
+from polishdict.api import iter_elements
+
+test_cases = [
+    # (description, html, expected (tag, attributes, text) tuples)
+    ("Elements come in end-tag order, children before parents",
+     '<div id="a"><b>x</b><i>y</i></div><p>z</p>',
+     [('b', {}, 'x'), ('i', {}, 'y'), ('div', {'id': 'a'}, ''), ('p', {}, 'z'),
+      ('body', {}, ''), ('html', {}, '')]),
+    ("Text is the element's own leading text, not its children's or tail",
+     '<div class="c">  lead <b>bold</b> tail <i>it</i> end</div>',
+     [('b', {}, 'bold'), ('i', {}, 'it'), ('div', {'class': 'c'}, 'lead'),
+      ('body', {}, ''), ('html', {}, '')]),
+    ("Entities are decoded and Polish text survives the round trip",
+     '<p title="żółw">zobacz hasło: &amp; <a>pies</a></p>',
+     [('a', {}, 'pies'), ('p', {'title': 'żółw'}, 'zobacz hasło: &'),
+      ('body', {}, ''), ('html', {}, '')]),
+]
+
+print("Testing element iteration:")
+print("=" * 80)
+
+for description, html, expected in test_cases:
+    actual = list(iter_elements(html))
+
+    status = "✓" if actual == expected else "✗"
+    print(f"{status} {description}")
+    print(f"   Expected: {expected}")
+    print(f"   Got:      {actual}")
+    print()
+
+# Processed elements must be removed as the document is read, so apart from
+# the path to the current element, at most one already-yielded sibling per
+# level is still attached (the parser may have read further ahead than that)
+parsed = []
+original_iterparse = etree.iterparse
+
+
+def recording_iterparse(*args, **kwargs):
+    """iterparse() that remembers the last element it produced"""
+    for event, element in original_iterparse(*args, **kwargs):
+        parsed[:] = [element]
+        yield event, element
+
+
+def processed_elements_kept(element):
+    """Count the already-parsed siblings still attached along element's ancestor chain"""
+    return sum(len(list(node.itersiblings(preceding=True)))
+               for node in [element, *element.iterancestors()])
+
+
+SIBLINGS = 5000
+large_html = '<div>' + ''.join(f'<p>item {i} <b>bold</b></p>' for i in range(SIBLINGS)) + '</div>'
+
+polishdict.api.etree.iterparse = recording_iterparse
+try:
+    most_kept = 0
+    count = 0
+    for count, _ in enumerate(iter_elements(large_html), 1):
+        most_kept = max(most_kept, processed_elements_kept(parsed[0]))
+finally:
+    polishdict.api.etree.iterparse = original_iterparse
+
+expected_count = SIBLINGS * 2 + 3  # <p> and <b> per item, plus div, body and html
+ok = count == expected_count and most_kept <= 4
+status = "✓" if ok else "✗"
+print(f"{status} Tree stays flat while iterating over {SIBLINGS} siblings")
+print(f"   Elements yielded: expected {expected_count}, got {count}")
+print(f"   Processed elements still attached: at most {most_kept} (expected at most 4)")
+print()
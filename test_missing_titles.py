@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Test page existence checks used by fetch_words (offline, canned API response)"""
+
+from polishdict.api import PolishDictionaryAPI
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Answers every action=query request with the same canned response"""
+
+    def __init__(self, data):
+        self.data = data
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(params)
+        return FakeResponse(self.data)
+
+
+# formatversion=2 response for titles=pies|Kot|dobra|psa|nope|zła
+canned_query = {
+    'query': {
+        # First letters are capitalised on en.wiktionary-style wikis
+        'normalized': [
+            {'from': 'dobra', 'to': 'Dobra'},
+            {'from': 'zła', 'to': 'Zła'},
+        ],
+        'redirects': [
+            {'from': 'psa', 'to': 'pies'},
+            {'from': 'Zła', 'to': 'zło'},
+        ],
+        'pages': [
+            {'title': 'pies', 'pageid': 1},
+            {'title': 'Kot', 'ns': 0, 'missing': True},
+            {'title': 'Dobra', 'ns': 0, 'missing': True},
+            {'title': 'nope', 'ns': 0, 'missing': True},
+            {'title': 'zło', 'pageid': 2},
+        ],
+    }
+}
+
+test_cases = [
+    # (word, expected_missing)
+    ("pies", False),   # Page exists as-is
+    ("Kot", True),     # Missing as-is
+    ("dobra", True),   # Normalized to "Dobra", which is missing
+    ("psa", False),    # Redirects to "pies", which exists
+    ("nope", True),    # Missing as-is
+    ("zła", False),    # Normalized to "Zła", then redirects to "zło", which exists
+]
+
+api = PolishDictionaryAPI()
+api.session = FakeSession(canned_query)
+
+words = [word for word, _ in test_cases]
+missing = api._missing_titles('en', words)
+
+print("Testing page existence checks (normalization and redirects):")
+print("=" * 80)
+print(f"Requested titles: {api.session.requests[0]['titles']}")
+print()
+
+for word, expected_missing in test_cases:
+    actual_missing = word in missing
+    status = "✓" if actual_missing == expected_missing else "✗"
+    print(f"{status} '{word}'")
+    print(f"   Expected missing: {expected_missing}, Got: {actual_missing}")
+    print()
+
+# A failed check must not report anything as missing, so every word is still fetched
+failing_api = PolishDictionaryAPI()
+failing_api.session = FakeSession({'error': {'code': 'internal_api_error'}})
+missing_on_error = failing_api._missing_titles('pl', words)
+status = "✓" if not missing_on_error else "✗"
+print(f"{status} Failed check reports no missing words (got {sorted(missing_on_error)})")
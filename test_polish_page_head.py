@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Test cutting Polish Wiktionary pages off after the Polish section (offline HTML fixtures)"""
+
+from polishdict.api import PolishDictionaryAPI
+
+api = PolishDictionaryAPI()
+
+POLISH = (
+    '<h2 id="dobra_(język_polski)"><span id="pl">dobra</span> (<a href="/wiki/j%C4%99zyk_polski">język polski</a>)</h2>'
+    '<dl><dt><span data-field="znaczenia">znaczenia:</span></dt><dd></dd></dl>'
+    '<p><i>rzeczownik, rodzaj nijaki</i></p>'
+    '<dl><dd>(1.1) ogół środków do zaspokojenia potrzeb</dd></dl>'
+)
+CZECH = (
+    '<h2 id="dobra_(język_czeski)">dobra (<a href="/x">język czeski</a>)</h2>'
+    '<p>zobacz hasło: <a href="/wiki/dobr%C3%BD">dobrý</a></p>'
+    '<dl><dt><span data-field="znaczenia">znaczenia:</span></dt><dd></dd></dl>'
+    '<p><i>przymiotnik</i></p>'
+    '<dl><dd>(1.1) forma przymiotnika dobrý</dd></dl>'
+)
+ENGLISH = '<h2 id="dobra_(język_angielski)">dobra (<a href="/y">język angielski</a>)</h2><p>forma <a>x</a></p>'
+
+test_cases = [
+    # (description, html, expected_head, expected_lemma, expected_definition_count)
+    ("Trailing language section is cut off",
+     POLISH + CZECH,
+     POLISH, None, 1),
+    ("Earlier sections are kept, later ones cut off",
+     ENGLISH + POLISH + CZECH,
+     ENGLISH + POLISH, 'x', 2),
+    ("Polish section only: whole page kept",
+     POLISH,
+     POLISH, None, 1),
+    # Form links are looked for on the whole page, as before the cut-off existed
+    ("No Polish heading: whole page kept",
+     CZECH,
+     CZECH, 'dobrý', 1),
+]
+
+print("Testing Polish section cut-off:")
+print("=" * 80)
+
+for description, html, expected_head, expected_lemma, expected_definitions in test_cases:
+    head = api._polish_page_head(html)
+    result = api._parse_polish_wiktionary_html(html, 'dobra')
+
+    ok = (head == expected_head and
+          result['lemma'] == expected_lemma and
+          len(result['definitions']) == expected_definitions)
+    status = "✓" if ok else "✗"
+    print(f"{status} {description}")
+    print(f"   Head: {len(head)} of {len(html)} chars (expected {len(expected_head)})")
+    print(f"   Lemma: expected {expected_lemma!r}, got {result['lemma']!r}")
+    print(f"   Definitions: expected {expected_definitions}, got {len(result['definitions'])}")
+    print()